@@ -240,9 +240,10 @@ class AngelStudioSession:
             try:
                 import os
 
-                if os.path.exists(self.session_file):
-                    os.remove(self.session_file)
-                    return True
+                # Remove directly rather than exists()+remove(): one syscall, no race
+                os.remove(self.session_file)
+            except FileNotFoundError:
+                pass
             except Exception:
                 return False
         return True
@@ -10,14 +10,14 @@ import xbmc  # type: ignore
 import xbmcgui  # type: ignore
 import xbmcplugin  # type: ignore
 
-from kodi_utils import timed, TimedBlock
+from kodi_utils import get_cond_visibility, HAS_ISA_CONDITION, timed, TimedBlock
 
 try:
     from menu_projects import ProjectsMenu as ProjectsMenuClass
 except ImportError:
     ProjectsMenuClass = None
 
-from menu_utils import MenuUtils
+from menu_utils import MenuUtils, ART_PATH_MAP, LANDSCAPE_STILL_KEYS, PORTRAIT_STILL_KEYS, POSTER_STILL_KEYS
 
 
 class KodiMenuHandler(MenuUtils):
@@ -120,7 +120,7 @@ class KodiMenuHandler(MenuUtils):
         # Create directory items for each menu option
         for item in self.menu_items:
             # Create list item
-            list_item = xbmcgui.ListItem(label=item["label"])
+            list_item = xbmcgui.ListItem(label=item["label"], offscreen=True)
 
             if item.get("icon"):
                 list_item.setArt({"icon": item["icon"], "thumb": item["icon"]})
@@ -230,7 +230,7 @@ class KodiMenuHandler(MenuUtils):
                     xbmcplugin.addDirectoryItem(self.handle, url, list_item, True)
 
                 # Add "All Episodes" item at the bottom
-                list_item = xbmcgui.ListItem(label="[All Episodes]")
+                list_item = xbmcgui.ListItem(label="[All Episodes]", offscreen=True)
                 info_tag = list_item.getVideoInfoTag()
                 info_tag.setMediaType(self.parent._get_kodi_content_type(content_type))
                 info_tag.setPlot("Browse all episodes from all seasons")
@@ -444,7 +444,7 @@ class KodiMenuHandler(MenuUtils):
             if page_info.get("hasNextPage"):
                 end_cursor = page_info.get("endCursor")
                 if end_cursor:
-                    list_item = xbmcgui.ListItem(label="[Load More...]")
+                    list_item = xbmcgui.ListItem(label="[Load More...]", offscreen=True)
                     info_tag = list_item.getVideoInfoTag()
                     info_tag.setPlot("Load more continue watching items")
                     url = self.create_plugin_url(
@@ -480,12 +480,14 @@ class KodiMenuHandler(MenuUtils):
         - project: Optional project dict (for playback metadata).
         - content_type: For directory media type.
         - stream_url: If provided, enables playback mode.
-        - is_playback: True for playback mode (sets offscreen, path, etc.).
+        - is_playback: True for playback mode (sets path, etc.).
         """
         self.log.info(
             f"Creating ListItem for episode: {episode.get('name', 'Unknown Episode')}, is_playback={is_playback}"
         )
-        episode_available = bool(episode.get("source"))
+        # Resolve the stream source once; it drives availability, manifest URL and duration
+        source = episode.get("source") or {}
+        episode_available = bool(source)
         episode_subtitle = episode.get("subtitle", episode.get("name", "Unknown Episode"))
 
         # If the episode is not available (no source), indicate that in the subtitle with italics.
@@ -494,7 +496,7 @@ class KodiMenuHandler(MenuUtils):
 
         # Both directory items and playback items must be set to IsPlayable true
         # if the episode is available.
-        list_item = xbmcgui.ListItem(label=episode_subtitle, offscreen=is_playback)
+        list_item = xbmcgui.ListItem(label=episode_subtitle, offscreen=True)
         list_item.setProperty("IsPlayable", "true" if episode_available else "false")
 
         # Create ListItem
@@ -502,7 +504,7 @@ class KodiMenuHandler(MenuUtils):
             quality_pref = self.parent._get_quality_pref()
             quality_mode = quality_pref["mode"]
             target_height = quality_pref["target_height"]
-            manifest_url = (episode.get("source") or {}).get("url", stream_url)
+            manifest_url = source.get("url", stream_url)
 
             list_item.setIsFolder(False)
 
@@ -516,7 +518,7 @@ class KodiMenuHandler(MenuUtils):
             if use_isa:
                 isa_ready = self.parent._ensure_isa_available("hls")
                 if not isa_ready:
-                    isa_ready = xbmc.getCondVisibility("System.HasAddon(inputstream.adaptive)")
+                    isa_ready = get_cond_visibility(HAS_ISA_CONDITION)
                     if isa_ready:
                         self.log.info("ISA detected via System.HasAddon; proceeding without inputstreamhelper")
 
@@ -598,7 +600,7 @@ class KodiMenuHandler(MenuUtils):
         # Set media type and additional metadata
         info_tag = list_item.getVideoInfoTag()
         if episode_available:
-            info_tag.setDuration(episode.get("source", {}).get("duration", 0))
+            info_tag.setDuration(source.get("duration", 0))
         if is_playback:
             info_tag.setMediaType("video")
             # Additional playback metadata from project
@@ -703,27 +705,19 @@ class KodiMenuHandler(MenuUtils):
 
         # Handle artwork with URL reuse
         art_dict = {}
-        poster_path = info_dict.get("discoveryPosterCloudinaryPath") or info_dict.get("posterCloudinaryPath")
-        if poster_path:
-            art_dict["poster"] = self.parent.angel_interface.get_cloudinary_url(poster_path)
-
-        landscape_path = info_dict.get("discoveryPosterLandscapeCloudinaryPath") or info_dict.get(
-            "posterLandscapeCloudinaryPath"
-        )
-        if landscape_path:
-            url = self.parent.angel_interface.get_cloudinary_url(landscape_path)
-            art_dict["landscape"] = url
-            art_dict["fanart"] = url  # Reuse: avoids duplicate get_cloudinary_url() call
-
-        logo_path = info_dict.get("logoCloudinaryPath")
-        if logo_path:
-            url = self.parent.angel_interface.get_cloudinary_url(logo_path)
-            art_dict["logo"] = url
-            art_dict["clearlogo"] = url
-            art_dict["icon"] = url  # Reuse: same URL for all logo variants
+        for path_keys, art_keys in ART_PATH_MAP:
+            path = None
+            for path_key in path_keys:
+                path = info_dict.get(path_key)
+                if path:
+                    break
+            if path:
+                url = self.parent.angel_interface.get_cloudinary_url(path)
+                for art_key in art_keys:
+                    art_dict[art_key] = url  # Reuse: one URL per path for every art key
 
         # Handle stills
-        for still_key in ("portraitStill1", "portraitStill2", "portraitTitleImage"):
+        for still_key in PORTRAIT_STILL_KEYS:
             self.log.debug(f"[ART] Processing still_key: {still_key}", category="art")
             still_dict = info_dict.get(still_key)
             self.log.debug(f"[ART] still_dict from info_dict: {still_dict}", category="art")
@@ -741,20 +735,13 @@ class KodiMenuHandler(MenuUtils):
                 if cp:
                     url = self.parent.angel_interface.get_cloudinary_url(cp)
                     self.log.debug(f"[ART] url: {url}", category="art")
-                    if still_key == "portraitTitleImage":
-                        self.log.debug(f"[ART] direct portraitTitleImage: {still_dict}", category="art")
-                        self.log.debug(f"[ART] Using direct portraitTitleImage: {cp}", category="art")
-                        art_dict["poster"] = url
-                        self.log.debug(f"[ART] Set poster to portraitTitleImage: {url}", category="art")
-                    elif still_key == "portraitStill1":
-                        self.log.debug(f"[ART] Using {still_key}: {cp}", category="art")
+                    self.log.debug(f"[ART] Using {still_key}: {cp}", category="art")
+                    if still_key in POSTER_STILL_KEYS:
                         art_dict["poster"] = url
                         self.log.debug(f"[ART] Set poster to {still_key}: {url}", category="art")
-                    else:
-                        self.log.debug(f"[ART] Using {still_key}: {cp}", category="art")
                     art_dict.setdefault("thumb", url)
 
-        for still_key in ("landscapeStill1", "landscapeStill2"):
+        for still_key in LANDSCAPE_STILL_KEYS:
             still_dict = info_dict.get(still_key)
             if isinstance(still_dict, dict):
                 cp = still_dict.get("cloudinaryPath")
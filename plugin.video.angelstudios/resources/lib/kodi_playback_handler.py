@@ -3,10 +3,11 @@ Kodi Playback Handler for Angel Studios addon.
 Handles all Kodi-specific playback operations and stream resolution.
 """
 
-import xbmc  # type: ignore
 import xbmcgui  # type: ignore
 import xbmcplugin  # type: ignore
 
+from kodi_utils import get_cond_visibility, HAS_ISA_CONDITION, HAS_ISA_HELPER_CONDITION
+
 
 class KodiPlaybackHandler:
     """Handles playback operations and stream resolution for Kodi UI."""
@@ -127,21 +128,23 @@ class KodiPlaybackHandler:
 
     def _ensure_isa_available(self, manifest_type: str = "hls") -> bool:
         """Check if InputStream Adaptive is available (and installed/enabled)."""
-        has_helper = xbmc.getCondVisibility("System.HasAddon(script.module.inputstreamhelper)")
-        has_isa = xbmc.getCondVisibility("System.HasAddon(inputstream.adaptive)")
+        has_helper = get_cond_visibility(HAS_ISA_HELPER_CONDITION)
 
         if not has_helper:
+            has_isa = get_cond_visibility(HAS_ISA_CONDITION)
             if has_isa:
                 self.log.info("inputstreamhelper not installed; inputstream.adaptive present via System.HasAddon")
             else:
                 self.log.info("inputstreamhelper not installed; inputstream.adaptive not detected; skipping ISA setup")
             return has_isa
 
+        # The helper is present, so System.HasAddon(inputstream.adaptive) is only
+        # needed as a fallback when the helper cannot be used.
         try:
             from inputstreamhelper import Helper  # type: ignore
         except Exception as exc:  # pragma: no cover - defensive
             self.log.warning(f"inputstreamhelper present but import failed: {exc}")
-            return has_isa
+            return get_cond_visibility(HAS_ISA_CONDITION)
 
         try:
             is_helper = Helper(manifest_type)
@@ -151,7 +154,7 @@ class KodiPlaybackHandler:
             return result
         except Exception as exc:  # pragma: no cover - defensive
             self.log.warning(f"inputstreamhelper check failed: {exc}")
-            return has_isa
+            return get_cond_visibility(HAS_ISA_CONDITION)
 
     def _get_quality_pref(self):
         """Return dict with 'mode' and 'target_height'. mode in {'auto','fixed','manual'}."""
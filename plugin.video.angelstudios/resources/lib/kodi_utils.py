@@ -1,10 +1,18 @@
 import xbmc  # type: ignore
 import xbmcaddon  # type: ignore
 import xbmcvfs  # type: ignore
+import functools
 import os
-import inspect
+import sys
 import time
 
+# Kodi log levels, bound once so the per-call path skips the xbmc attribute lookups
+_LOGDEBUG = xbmc.LOGDEBUG
+_LOGINFO = xbmc.LOGINFO
+_LOGWARNING = xbmc.LOGWARNING
+_LOGERROR = xbmc.LOGERROR
+_LOGFATAL = xbmc.LOGFATAL
+
 
 class KodiLogger:
     """Simple logger class to log messages to Kodi log with category-based debug promotion"""
@@ -20,13 +28,12 @@ class KodiLogger:
         self.category_promotions = category_promotions or {}
         self.uncategorized_promotion = uncategorized_promotion
         self.miscategorized_promotion = miscategorized_promotion
-        self._caller_cache = {}  # Cache for caller info to improve performance
 
     def debug(self, message, category=None):
         """Log debug message with optional category-based promotion to INFO level."""
         # Check promote_all_debug first - overrides everything
         if self.promote_all_debug:
-            self.xbmclog(f"(all-debug) {message}", xbmc.LOGINFO)
+            self.xbmclog(f"(all-debug) {message}", _LOGINFO)
             return
 
         # Determine promotion based on category
@@ -38,7 +45,7 @@ class KodiLogger:
                 # Unknown category - use miscategorized promotion
                 is_promoted = self.miscategorized_promotion
                 prefix = "(misc-debug)"
-                self.xbmclog(f"Unknown debug category '{category}' - consider adding setting", xbmc.LOGINFO)
+                self.xbmclog(f"Unknown debug category '{category}' - consider adding setting", _LOGINFO)
         else:
             # No category - use uncategorized promotion
             is_promoted = self.uncategorized_promotion
@@ -46,21 +53,21 @@ class KodiLogger:
 
         if is_promoted:
             promoted_message = f"{prefix} {message}"
-            self.xbmclog(promoted_message, xbmc.LOGINFO)
+            self.xbmclog(promoted_message, _LOGINFO)
         else:
-            self.xbmclog(message, xbmc.LOGDEBUG)
+            self.xbmclog(message, _LOGDEBUG)
 
     def info(self, message):
-        self.xbmclog(message, xbmc.LOGINFO)
+        self.xbmclog(message, _LOGINFO)
 
     def warning(self, message):
-        self.xbmclog(message, xbmc.LOGWARNING)
+        self.xbmclog(message, _LOGWARNING)
 
     def error(self, message):
-        self.xbmclog(message, xbmc.LOGERROR)
+        self.xbmclog(message, _LOGERROR)
 
     def critical(self, message):
-        self.xbmclog(message, xbmc.LOGFATAL)
+        self.xbmclog(message, _LOGFATAL)
 
     def xbmclog(self, message, level):
         """Log a message to Kodi's log with the specified level"""
@@ -68,61 +75,33 @@ class KodiLogger:
         xbmc.log(f"Angel Studios: Handler: {handler}: {message}", level)
 
     def _get_caller_info(self):
-        """Get caller info with caching to reduce stack inspection overhead."""
-        # Create cache key from current frame info
-        frame = inspect.currentframe()
+        """Get caller info, reusing the formatted handler string for repeat callers."""
+        # Start above _get_caller_info and xbmclog, then skip the level helpers
+        # (debug/info/...) and any other frames from this module.
+        frame = sys._getframe(2)
+        while frame is not None and frame.f_globals.get("__name__") == __name__:
+            frame = frame.f_back
         if frame is None:
             return "Unknown Handler"
 
         try:
-            # Walk up stack to find the actual caller (skip xbmclog and _get_caller_info)
-            caller_frame = frame.f_back.f_back  # type: ignore  # Skip xbmclog and _get_caller_info
-
-            # Use filename and line number as cache key
-            filename = caller_frame.f_code.co_filename  # type: ignore
-            lineno = caller_frame.f_lineno  # type: ignore
-            cache_key = f"{filename}:{lineno}"
-
-            # Check cache first
-            if cache_key in self._caller_cache:
-                return self._caller_cache[cache_key]
-
-            # Not cached, compute handler info
-            handler = self._compute_caller_info(caller_frame)
-
-            # Cache the result (limit cache size to prevent memory leaks)
-            if len(self._caller_cache) < 1000:  # Reasonable limit
-                self._caller_cache[cache_key] = handler
-
-            return handler
+            self_obj = frame.f_locals.get("self")
+            if not self_obj:
+                return "Unknown Handler"
+            return _format_caller_info(
+                frame.f_globals.get("__name__"),
+                self_obj.__class__.__name__,
+                frame.f_code.co_name,
+            )
         finally:
             del frame
 
-    def _compute_caller_info(self, frame_info):
-        """Compute caller info from a frame (original logic, now extracted for clarity)."""
-        module = inspect.getmodule(frame_info)
-        module_name = module.__name__ if module else None
-
-        # Skip frames from this helpers module to find the caller
-        if module_name and module_name.startswith(__name__):
-            return "Unknown Handler"
-
-        self_obj = frame_info.f_locals.get("self")
-        if not self_obj:
-            return "Unknown Handler"
-
-        class_name = self_obj.__class__.__name__
-        function_name = frame_info.f_code.co_name
 
-        parts = []
-        if module_name:
-            parts.append(module_name)
-        if class_name:
-            parts.append(class_name)
-        if function_name:
-            parts.append(function_name)
-
-        return ".".join(parts) if parts else "Unknown Handler"
+@functools.lru_cache(maxsize=1024)
+def _format_caller_info(module_name, class_name, function_name):
+    """Build the 'module.Class.function' handler string (bounded LRU memoization)."""
+    parts = [part for part in (module_name, class_name, function_name) if part]
+    return ".".join(parts) if parts else "Unknown Handler"
 
 
 def get_session_file():
@@ -135,6 +114,37 @@ def get_session_file():
     return os.path.join(cache_dir, "angel_session.pkl")
 
 
+# Condition results are reused briefly so repeated checks during one request
+# (e.g. ISA detection, then the playback fallback) cross into Kodi only once.
+COND_VISIBILITY_TTL = 1.0  # seconds
+_cond_visibility_cache = {}
+
+HAS_ISA_HELPER_CONDITION = "System.HasAddon(script.module.inputstreamhelper)"
+HAS_ISA_CONDITION = "System.HasAddon(inputstream.adaptive)"
+
+
+def get_cond_visibility(condition):
+    """Return xbmc.getCondVisibility(condition), cached for COND_VISIBILITY_TTL seconds."""
+    now = time.monotonic()
+    cached = _cond_visibility_cache.get(condition)
+    if cached is not None and now - cached[0] < COND_VISIBILITY_TTL:
+        return cached[1]
+    value = xbmc.getCondVisibility(condition)
+    _cond_visibility_cache[condition] = (now, value)
+    return value
+
+
+_performance_logging_enabled = None
+
+
+def performance_logging_enabled():
+    """Return the enable_performance_logging setting, read once per process."""
+    global _performance_logging_enabled
+    if _performance_logging_enabled is None:
+        _performance_logging_enabled = bool(xbmcaddon.Addon().getSettingBool("enable_performance_logging"))
+    return _performance_logging_enabled
+
+
 def timed(context_func=None, metrics_func=None):
     """Decorator to time function execution and log if performance logging is enabled.
 
@@ -147,11 +157,10 @@ def timed(context_func=None, metrics_func=None):
 
     def decorator(func):
         def wrapper(*args, **kwargs):
-            addon = xbmcaddon.Addon()
-            if addon.getSettingBool("enable_performance_logging"):
-                start = time.perf_counter()
+            if performance_logging_enabled():
+                start = time.perf_counter_ns()
                 result = func(*args, **kwargs)
-                elapsed = (time.perf_counter() - start) * 1000  # ms
+                elapsed = (time.perf_counter_ns() - start) / 1e6  # ms
 
                 context = ""
                 if context_func:
@@ -175,7 +184,7 @@ def timed(context_func=None, metrics_func=None):
                     except Exception as e:
                         metrics = f" (metrics_error: {e})"
 
-                xbmc.log(f"[PERF] {func.__name__}{context}{metrics}: {elapsed:.2f}ms", xbmc.LOGINFO)
+                xbmc.log(f"[PERF] {func.__name__}{context}{metrics}: {elapsed:.2f}ms", _LOGINFO)
                 return result
             return func(*args, **kwargs)
 
@@ -192,12 +201,11 @@ class TimedBlock:
         self.start = None
 
     def __enter__(self):
-        addon = xbmcaddon.Addon()
-        if addon.getSettingBool("enable_performance_logging"):
-            self.start = time.perf_counter()
+        if performance_logging_enabled():
+            self.start = time.perf_counter_ns()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         if self.start is not None:
-            elapsed = (time.perf_counter() - self.start) * 1000  # ms
-            xbmc.log(f"[PERF] {self.name}: {elapsed:.2f}ms", xbmc.LOGINFO)
+            elapsed = (time.perf_counter_ns() - self.start) / 1e6  # ms
+            xbmc.log(f"[PERF] {self.name}: {elapsed:.2f}ms", _LOGINFO)
@@ -4,7 +4,7 @@ Shared utilities and mappings used across menu handlers.
 """
 
 import xbmcgui  # type: ignore
-from kodi_utils import TimedBlock
+from kodi_utils import get_cond_visibility, HAS_ISA_CONDITION, TimedBlock
 from urllib.parse import urlencode
 
 # Map menu content types to Angel Studios project types for API calls
@@ -21,6 +21,20 @@ kodi_content_mapper = {
     "specials": "videos",
 }
 
+# Artwork sources for _process_attributes_to_infotags: each entry is
+# (cloudinary path keys in priority order, art keys that share the resulting URL)
+ART_PATH_MAP = (
+    (("discoveryPosterCloudinaryPath", "posterCloudinaryPath"), ("poster",)),
+    (("discoveryPosterLandscapeCloudinaryPath", "posterLandscapeCloudinaryPath"), ("landscape", "fanart")),
+    (("logoCloudinaryPath",), ("logo", "clearlogo", "icon")),
+)
+
+# Still images: portrait stills feed thumb (and poster for POSTER_STILL_KEYS),
+# landscape stills fill landscape/fanart when no landscape poster was found
+PORTRAIT_STILL_KEYS = ("portraitStill1", "portraitStill2", "portraitTitleImage")
+POSTER_STILL_KEYS = frozenset(("portraitStill1", "portraitTitleImage"))
+LANDSCAPE_STILL_KEYS = ("landscapeStill1", "landscapeStill2")
+
 
 class MenuUtils:
     """Shared utilities for menu operations."""
@@ -90,7 +104,7 @@ class MenuUtils:
         if content_type_str == "episode" and not content.get("source"):
             label = f"[I] {label} (Unavailable)[/I]"
 
-        list_item = xbmcgui.ListItem(label=label)
+        list_item = xbmcgui.ListItem(label=label, offscreen=True)
 
         # Set basic properties
         if content_type_str == "episode":
@@ -202,27 +216,19 @@ class MenuUtils:
 
         # Handle artwork with URL reuse
         art_dict = {}
-        poster_path = info_dict.get("discoveryPosterCloudinaryPath") or info_dict.get("posterCloudinaryPath")
-        if poster_path:
-            art_dict["poster"] = self.parent.angel_interface.get_cloudinary_url(poster_path)
-
-        landscape_path = info_dict.get("discoveryPosterLandscapeCloudinaryPath") or info_dict.get(
-            "posterLandscapeCloudinaryPath"
-        )
-        if landscape_path:
-            url = self.parent.angel_interface.get_cloudinary_url(landscape_path)
-            art_dict["landscape"] = url
-            art_dict["fanart"] = url  # Reuse: avoids duplicate get_cloudinary_url() call
-
-        logo_path = info_dict.get("logoCloudinaryPath")
-        if logo_path:
-            url = self.parent.angel_interface.get_cloudinary_url(logo_path)
-            art_dict["logo"] = url
-            art_dict["clearlogo"] = url
-            art_dict["icon"] = url  # Reuse: same URL for all logo variants
+        for path_keys, art_keys in ART_PATH_MAP:
+            path = None
+            for path_key in path_keys:
+                path = info_dict.get(path_key)
+                if path:
+                    break
+            if path:
+                url = self.parent.angel_interface.get_cloudinary_url(path)
+                for art_key in art_keys:
+                    art_dict[art_key] = url  # Reuse: one URL per path for every art key
 
         # Handle stills
-        for still_key in ("portraitStill1", "portraitStill2", "portraitTitleImage"):
+        for still_key in PORTRAIT_STILL_KEYS:
             still_dict = info_dict.get(still_key)
             if not isinstance(still_dict, dict):
                 # Check nested in title for projects
@@ -234,13 +240,11 @@ class MenuUtils:
                 if cp:
                     url = self.parent.angel_interface.get_cloudinary_url(cp)
                     self.log.debug(f"Using {still_key} for poster: {cp}", category="art")
-                    if still_key == "portraitTitleImage":
-                        art_dict["poster"] = url
-                    elif still_key == "portraitStill1":
+                    if still_key in POSTER_STILL_KEYS:
                         art_dict["poster"] = url
                     art_dict.setdefault("thumb", url)
 
-        for still_key in ("landscapeStill1", "landscapeStill2"):
+        for still_key in LANDSCAPE_STILL_KEYS:
             still_dict = info_dict.get(still_key)
             if isinstance(still_dict, dict):
                 cp = still_dict.get("cloudinaryPath")
@@ -264,12 +268,14 @@ class MenuUtils:
         - project: Optional project dict (for playback metadata).
         - content_type: For directory media type.
         - stream_url: If provided, enables playback mode.
-        - is_playback: True for playback mode (sets offscreen, path, etc.).
+        - is_playback: True for playback mode (sets path, etc.).
         """
         self.log.info(
             f"Creating ListItem for episode: {episode.get('name', 'Unknown Episode')}, is_playback={is_playback}"
         )
-        episode_available = bool(episode.get("source"))
+        # Resolve the stream source once; it drives availability, manifest URL and duration
+        source = episode.get("source") or {}
+        episode_available = bool(source)
         episode_subtitle = episode.get("subtitle", episode.get("name", "Unknown Episode"))
 
         # If the episode is not available (no source), indicate that in the subtitle with italics.
@@ -278,7 +284,7 @@ class MenuUtils:
 
         # Both directory items and playback items must be set to IsPlayable true
         # if the episode is available.
-        list_item = __import__("xbmcgui").ListItem(label=episode_subtitle, offscreen=is_playback)
+        list_item = __import__("xbmcgui").ListItem(label=episode_subtitle, offscreen=True)
         list_item.setProperty("IsPlayable", "true" if episode_available else "false")
 
         # Create ListItem
@@ -286,7 +292,7 @@ class MenuUtils:
             quality_pref = self.parent._get_quality_pref()
             quality_mode = quality_pref["mode"]
             target_height = quality_pref["target_height"]
-            manifest_url = (episode.get("source") or {}).get("url", stream_url)
+            manifest_url = source.get("url", stream_url)
 
             list_item.setIsFolder(False)
 
@@ -300,7 +306,7 @@ class MenuUtils:
             if use_isa:
                 isa_ready = self.parent._ensure_isa_available("hls")
                 if not isa_ready:
-                    isa_ready = __import__("xbmc").getCondVisibility("System.HasAddon(inputstream.adaptive)")
+                    isa_ready = get_cond_visibility(HAS_ISA_CONDITION)
                     if isa_ready:
                         self.log.info("ISA detected via System.HasAddon; proceeding without inputstreamhelper")
 
@@ -382,7 +388,7 @@ class MenuUtils:
         # Set media type and additional metadata
         info_tag = list_item.getVideoInfoTag()
         if episode_available:
-            info_tag.setDuration(episode.get("source", {}).get("duration", 0))
+            info_tag.setDuration(source.get("duration", 0))
         if is_playback:
             info_tag.setMediaType("video")
             # Additional playback metadata from project